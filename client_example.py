@@ -1,78 +1,104 @@
 """
 Example Python client for CV Filler API
 """
-import requests
-import json
+import asyncio
+
+import aiofiles
+import httpx
+
+
+DOCX_MEDIA_TYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+CHUNK_SIZE = 64 * 1024
 
 
 class CVFillerClient:
-    """Client for interacting with CV Filler API"""
-    
+    """Client for interacting with CV Filler API
+
+    Keeps one pooled connection open across calls; close it with aclose()
+    or use the client as an async context manager.
+    """
+
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url
-    
-    def fill_cv_from_files(self, template_path: str, json_path: str, output_path: str):
+        self._client = httpx.AsyncClient(base_url=base_url, timeout=60.0)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the underlying connection pool"""
+        await self._client.aclose()
+
+    async def fill_cv_from_files(self, template_path: str, json_path: str, output_path: str):
         """
         Fill CV using file uploads
-        
+
         Args:
             template_path: Path to empty DOCX template
             json_path: Path to JSON data file
             output_path: Where to save the filled CV
         """
-        url = f"{self.base_url}/fill-cv/"
-        
         with open(template_path, 'rb') as template_file, \
              open(json_path, 'rb') as json_file:
-            
+
+            # httpx streams the multipart body from the open file handles
             files = {
-                'template': ('template.docx', template_file, 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'),
+                'template': ('template.docx', template_file, DOCX_MEDIA_TYPE),
                 'cv_data_json': ('data.json', json_file, 'application/json')
             }
-            
-            response = requests.post(url, files=files)
-            response.raise_for_status()
-            
-            # Save the filled CV
-            with open(output_path, 'wb') as output_file:
-                output_file.write(response.content)
-            
+
+            async with self._client.stream('POST', '/fill-cv/', files=files) as response:
+                if response.is_error:
+                    await response.aread()
+                response.raise_for_status()
+
+                # Save the filled CV as it arrives
+                async with aiofiles.open(output_path, 'wb') as output_file:
+                    async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                        await output_file.write(chunk)
+
             return output_path
-    
-    def health_check(self):
+
+    async def health_check(self):
         """Check if API is running"""
         try:
-            response = requests.get(f"{self.base_url}/")
+            response = await self._client.get('/')
             return response.status_code == 200
         except:
             return False
 
 
+async def main():
+    async with CVFillerClient() as client:
+        # Check if API is running
+        if not await client.health_check():
+            print("❌ API is not running. Please start the API first.")
+            print("Run: python cv_filler_api.py")
+            exit(1)
+
+        print("✅ API is running")
+
+        # Fill CV
+        try:
+            output = await client.fill_cv_from_files(
+                template_path="empty_DOCX.docx",
+                json_path="JSON_input.json",
+                output_path="filled_cv_output.docx"
+            )
+            print(f"✅ CV filled successfully!")
+            print(f"Output saved to: {output}")
+        except httpx.HTTPStatusError as e:
+            print(f"❌ Error: {e}")
+            print(f"Response: {e.response.text}")
+        except FileNotFoundError as e:
+            print(f"❌ File not found: {e}")
+        except Exception as e:
+            print(f"❌ Unexpected error: {e}")
+
+
 # Example usage
 if __name__ == "__main__":
-    client = CVFillerClient()
-    
-    # Check if API is running
-    if not client.health_check():
-        print("❌ API is not running. Please start the API first.")
-        print("Run: python cv_filler_api.py")
-        exit(1)
-    
-    print("✅ API is running")
-    
-    # Fill CV
-    try:
-        output = client.fill_cv_from_files(
-            template_path="empty_DOCX.docx",
-            json_path="JSON_input.json",
-            output_path="filled_cv_output.docx"
-        )
-        print(f"✅ CV filled successfully!")
-        print(f"Output saved to: {output}")
-    except requests.exceptions.HTTPError as e:
-        print(f"❌ Error: {e}")
-        print(f"Response: {e.response.text}")
-    except FileNotFoundError as e:
-        print(f"❌ File not found: {e}")
-    except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+    asyncio.run(main())
@@ -0,0 +1,352 @@
+"""
+CV Render - Shared core that fills the CV table of a DOCX template from CV data
+"""
+
+import copy
+import re
+from collections import defaultdict
+from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Dict, List, Optional
+
+import ahocorasick
+from docx.document import Document
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from lxml import etree
+
+# Display order of the skill categories
+SKILL_CATEGORIES = (
+    "Programming Language",
+    "Backend Development",
+    "Frontend Development",
+    "Cloud & DevOps",
+    "Database",
+    "Web Services",
+    "CI/CD",
+    "Supporting tools",
+    "Methodologies",
+)
+
+# Skill keyword groups in matching priority order
+SKILL_KEYWORDS = (
+    ("Programming Language", ("C#", "Java", "JavaScript", "TypeScript", "Python")),
+    ("Backend Development", (".NET Core", "Spring Boot", "Node.js")),
+    ("Frontend Development", ("Angular", "React", "Vue", "HTML", "CSS", "Bootstrap")),
+    ("Cloud & DevOps", ("AWS", "Azure", "Docker", "Kubernetes")),
+    ("Database", ("PostgreSQL", "MySQL", "MSSQL", "MongoDB", "Oracle")),
+    ("Web Services", ("REST", "SOAP", "GraphQL")),
+    ("CI/CD", ("Jenkins", "Azure DevOps", "CI/CD", "GitHub Actions")),
+    ("Supporting tools", ("Git", "Jira", "Maven", "NPM", "SonarQube", "Swagger")),
+    ("Backend Development", ("SnapLogic", "MuleSoft", "Boomi")),
+)
+
+
+# Flattened (lowercase keyword, category) rules; a lower index wins
+_SKILL_RULES = tuple(
+    (keyword.lower(), category)
+    for category, keywords in SKILL_KEYWORDS
+    for keyword in keywords
+)
+
+
+def _build_skill_automaton() -> ahocorasick.Automaton:
+    """Compile every skill rule into a single Aho-Corasick automaton"""
+    automaton = ahocorasick.Automaton()
+    for index, (keyword, _) in enumerate(_SKILL_RULES):
+        # Keep the first (highest-priority) rule for duplicate keywords
+        if not automaton.exists(keyword):
+            automaton.add_word(keyword, index)
+    automaton.make_automaton()
+    return automaton
+
+
+SKILL_AUTOMATON = _build_skill_automaton()
+
+
+def _run_properties(
+    *,
+    bold: bool = False,
+    italic: bool = False,
+    color: Optional[str] = None,
+    size_pt: Optional[int] = None,
+):
+    """Build a <w:rPr> prototype; children follow the schema order of CT_RPr"""
+    rPr = OxmlElement("w:rPr")
+    if bold:
+        etree.SubElement(rPr, qn("w:b"))
+    if italic:
+        etree.SubElement(rPr, qn("w:i"))
+    if color:
+        etree.SubElement(rPr, qn("w:color")).set(qn("w:val"), color)
+    if size_pt:
+        etree.SubElement(rPr, qn("w:sz")).set(qn("w:val"), str(size_pt * 2))
+    return rPr
+
+
+# Run formatting shared by every filled CV, copied into each run
+NAME_STYLE = _run_properties(bold=True, size_pt=16)
+POSITION_STYLE = _run_properties(size_pt=11)
+HEADING_STYLE = _run_properties(bold=True, size_pt=10, color="C00000")
+TITLE_STYLE = _run_properties(bold=True, size_pt=9)
+BODY_STYLE = _run_properties(size_pt=9)
+TECHNOLOGIES_STYLE = _run_properties(italic=True, size_pt=8)
+
+# Tabs and line breaks become <w:tab/> and <w:br/>, as with python-docx runs
+_RUN_SPECIAL_CHARS = re.compile(r"([\t\r\n])")
+
+
+def _fast_paragraph(tc, text: Optional[str] = None, style=None):
+    """Append a single-run paragraph to a <w:tc> element, bypassing python-docx wrappers"""
+    p = etree.SubElement(tc, qn("w:p"))
+    if text is None:
+        return p
+
+    r = etree.SubElement(p, qn("w:r"))
+    if style is not None:
+        r.append(copy.deepcopy(style))
+
+    for chunk in _RUN_SPECIAL_CHARS.split(text):
+        if chunk == "\t":
+            etree.SubElement(r, qn("w:tab"))
+        elif chunk in ("\r", "\n"):
+            etree.SubElement(r, qn("w:br"))
+        elif chunk:
+            t = etree.SubElement(r, qn("w:t"))
+            t.text = chunk
+            if len(chunk.strip()) < len(chunk):
+                t.set(qn("xml:space"), "preserve")
+    return p
+
+
+def _clear_cell(cell):
+    """Remove all content from a cell, keeping only its <w:tcPr>"""
+    tc = cell._tc
+    for child in list(tc):
+        if child.tag != qn("w:tcPr"):
+            tc.remove(child)
+
+
+def _fill_cells(cells, section):
+    """Replace the content of each cell with a copy of the section's paragraphs"""
+    paragraphs = list(section)
+    for cell in cells:
+        _clear_cell(cell)
+        cell._tc.extend(copy.deepcopy(paragraphs))
+
+
+# Lowercase English month names -> month number, replacing strptime's "%B"
+_MONTHS = {
+    month: number
+    for number, month in enumerate(
+        (
+            "january",
+            "february",
+            "march",
+            "april",
+            "may",
+            "june",
+            "july",
+            "august",
+            "september",
+            "october",
+            "november",
+            "december",
+        ),
+        start=1,
+    )
+}
+
+
+@lru_cache(maxsize=256)
+def _parse_month_year(date_str: str) -> Optional[datetime]:
+    """Parse a "Month YYYY" date, or None if it does not match"""
+    # Accept exactly what strptime does: no surrounding whitespace, four-digit year
+    if date_str != date_str.strip():
+        return None
+    try:
+        month, year = date_str.split()
+    except ValueError:
+        return None
+    if len(year) != 4 or not year.isdecimal():
+        return None
+    month_number = _MONTHS.get(month.lower())
+    year_number = int(year)
+    if month_number is None or year_number == 0:
+        return None
+    return datetime(year_number, month_number, 1)
+
+
+def _parse_date(date_str: str) -> datetime:
+    """Parse date string for sorting"""
+    if not date_str or date_str.lower() == "current":
+        return datetime.now()
+    return _parse_month_year(date_str) or datetime.now()
+
+
+def render_cv(doc: Document, data: Dict[str, Any]) -> Document:
+    """Fill the CV table of the document in place with plain-dict CV data"""
+
+    # The CV is structured as a single table with specific cells
+    if not doc.tables:
+        raise ValueError("Template document does not contain any tables")
+
+    table = doc.tables[0]
+
+    # Fill header (Row 0, Cell 1) - Name and Position
+    _fill_header(table, data["personal_info"])
+
+    # Fill Summary (Row 1, Cells 0 and 1)
+    _fill_summary(table, data["other_info"])
+
+    # Fill Education and Industry Knowledge (Row 1, Cell 2)
+    _fill_education_and_industry(table, data["education"], data["projects"])
+
+    # Fill Skills (Row 2, Cell 2)
+    _fill_skills(table, data["programming_skills"], data["soft_skills"])
+
+    # Fill Professional Experience (Row 2-3, Cells 0-1)
+    _fill_professional_experience(table, data["projects"])
+
+    return doc
+
+
+def _fill_header(table, personal_info: Dict[str, Any]):
+    """Fill the header with name and position"""
+    cell = table.rows[0].cells[1]
+    _clear_cell(cell)  # Clear existing content
+
+    # Add name
+    _fast_paragraph(cell._tc, personal_info["name"], NAME_STYLE)
+
+    # Determine position from additional info or use default
+    additional = personal_info.get("additional") or {}
+    position = additional.get("position", "Integration Developer")
+    _fast_paragraph(cell._tc, position, POSITION_STYLE)
+
+
+def _fill_summary(table, summary_text: str):
+    """Fill the summary section"""
+    section = OxmlElement("w:tc")
+
+    # Add SUMMARY header
+    _fast_paragraph(section, "SUMMARY", HEADING_STYLE)
+
+    # Add summary text
+    _fast_paragraph(section, summary_text, BODY_STYLE)
+
+    # Summary appears in both cell[1,0] and cell[1,1] (merged cells)
+    _fill_cells(table.rows[1].cells[0:2], section)
+
+
+def _fill_education_and_industry(
+    table, education: List[Dict[str, Any]], projects: List[Dict[str, Any]]
+):
+    """Fill education and industry knowledge section"""
+    cell = table.rows[1].cells[2]
+    _clear_cell(cell)
+    tc = cell._tc
+
+    # EDUCATION header
+    _fast_paragraph(tc, "EDUCATION", HEADING_STYLE)
+
+    # Add education entries
+    for edu in education:
+        edu_text = f"{edu['degree']} in {edu['field_of_study']} - {edu['institution']}"
+        _fast_paragraph(tc, edu_text, BODY_STYLE)
+
+    # Add spacing
+    _fast_paragraph(tc)
+    _fast_paragraph(tc)
+
+    # INDUSTRY KNOWLEDGE header
+    _fast_paragraph(tc, "INDUSTRY KNOWLEDGE", HEADING_STYLE)
+
+    # Extract unique industries from projects
+    industries = {
+        project["additional"]["industry"]
+        for project in projects
+        if "industry" in (project.get("additional") or {})
+    }
+
+    # Add industries
+    for industry in sorted(industries):
+        _fast_paragraph(tc, industry, BODY_STYLE)
+
+
+def _fill_skills(table, programming_skills: List[str], soft_skills: List[str]):
+    """Fill the skills section"""
+    cell = table.rows[2].cells[2]
+    _clear_cell(cell)
+    tc = cell._tc
+
+    # SKILLS header
+    _fast_paragraph(tc, "SKILLS", HEADING_STYLE)
+
+    # Group programming skills by category
+    skill_groups = _categorize_skills(programming_skills)
+
+    # Add skill categories
+    for category, skills in skill_groups.items():
+        _fast_paragraph(tc, f"{category}: {', '.join(skills)}", BODY_STYLE)
+
+    # Add soft skills
+    if soft_skills:
+        _fast_paragraph(tc, f"Soft Skills: {', '.join(soft_skills[:3])}", BODY_STYLE)
+
+
+def _categorize_skills(skills: List[str]) -> Dict[str, List[str]]:
+    """Categorize programming skills into logical groups"""
+    categories = defaultdict(list)
+
+    for skill in skills:
+        # The highest-priority rule found in the skill wins
+        hits = SKILL_AUTOMATON.iter(skill.lower())
+        rule = min((index for _, index in hits), default=None)
+        category = "Supporting tools" if rule is None else _SKILL_RULES[rule][1]
+        categories[category].append(skill)
+
+    # Keep the display order and drop empty categories
+    return {k: categories[k] for k in SKILL_CATEGORIES if k in categories}
+
+
+def _fill_professional_experience(table, projects: List[Dict[str, Any]]):
+    """Fill the professional experience section"""
+    section = OxmlElement("w:tc")
+
+    # Add PROFESSIONAL EXPERIENCE header
+    _fast_paragraph(section, "PROFESSIONAL EXPERIENCE", HEADING_STYLE)
+
+    # Add projects in reverse chronological order (most recent first)
+    decorated = [
+        (_parse_date(project.get("start_date")), project) for project in projects
+    ]
+    decorated.sort(key=itemgetter(0), reverse=True)
+    sorted_projects = [project for _, project in decorated]
+
+    for project in sorted_projects:
+        # Add spacing
+        _fast_paragraph(section)
+
+        # Project name and dates
+        # Only include date range if there's actual date information
+        start_date = project.get("start_date") or ""
+        end_date = project.get("end_date") or ""
+        if start_date or end_date:
+            title = f"{project['name']} ({start_date} - {end_date})"
+        else:
+            title = project["name"]
+        _fast_paragraph(section, title, TITLE_STYLE)
+
+        # Project description
+        _fast_paragraph(section, project["description"], BODY_STYLE)
+
+        # Technologies
+        if project.get("technologies"):
+            tech_text = f"Technologies: {', '.join(project['technologies'])}"
+            _fast_paragraph(section, tech_text, TECHNOLOGIES_STYLE)
+
+    # Professional experience spans rows 2-3, cells 0-1
+    # We'll use row 2, cells 0-1 for the content
+    _fill_cells(table.rows[2].cells[0:2], section)